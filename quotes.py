@@ -13,6 +13,27 @@ INSPIRATIONAL_QUOTES = [
     ("The mind is everything. What you think you become.", "Buddha")
 ]
 
+# Quotes and authors split into parallel tuples so a pick is a single index
+_QUOTES = tuple(quote for quote, _ in INSPIRATIONAL_QUOTES)
+_AUTHORS = tuple(author for _, author in INSPIRATIONAL_QUOTES)
+_BLUE = discord.Color.blue()
+
+
+def _make_embed(quote: str, author: str) -> discord.Embed:
+    """Builds the embed for a single quote."""
+    embed = discord.Embed(
+        description=f'"{quote}"',
+        color=_BLUE
+    )
+    embed.set_footer(text=f"- {author}")
+    return embed
+
+
+# The quote set is static, so every embed is built once at import.
+# These are shared between invocations and must be treated as read-only.
+_EMBEDS = tuple(_make_embed(q, a) for q, a in zip(_QUOTES, _AUTHORS))
+_N = len(_EMBEDS)
+
 class QuotesCog(commands.Cog, name="Quotes"):
     """A cog for providing inspirational quotes."""
 
@@ -22,15 +43,7 @@ class QuotesCog(commands.Cog, name="Quotes"):
     @commands.command(name="quote", help="Get a random inspirational quote.")
     async def quote(self, ctx: commands.Context):
         """Sends a random inspirational quote."""
-        selected_quote, author = random.choice(INSPIRATIONAL_QUOTES)
-
-        embed = discord.Embed(
-            description=f'"{selected_quote}"',
-            color=discord.Color.blue()
-        )
-        embed.set_footer(text=f"- {author}")
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_EMBEDS[random.randrange(_N)])
 
 async def setup(bot: commands.Bot):
     """This is the setup function for the cog."""
@@ -1,15 +1,29 @@
 import os
 import json
 import time
+import random
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-
-import requests
-from web3 import Web3
+import functools
+import collections
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+import aiohttp
+import orjson
+from web3 import Web3, AsyncWeb3
+from web3.providers.websocket import WebsocketProviderV2
 from web3.contract import Contract
 from web3.logs import DISCARD
 from web3.exceptions import ContractLogicError
 from dotenv import load_dotenv
+from eth_abi import decode as abi_decode
+from eth_utils import event_abi_to_log_topic
+
+try:
+    # Faster event loop; optional since it is not available on every platform (e.g. Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # --- Configuration Setup ---
 # It's a best practice to load configurations from environment variables
@@ -29,6 +43,65 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Base delays in seconds before each relay retry; a relay is attempted len(_BACKOFF) + 1 times
+_BACKOFF = tuple(2.0 ** i for i in range(2))
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(address: Union[str, bytes]) -> str:
+    """
+    Memoized checksum address conversion.
+
+    Checksumming hashes the address with Keccak256, and the same addresses
+    (the bridge contract, common tokens, repeat users) recur constantly.
+    """
+    return Web3.to_checksum_address(address)
+
+
+# --- Mock Contract ABI ---
+# In a real project, this would be loaded from a JSON file.
+# Parsed once at import, along with the ABI entry of the relayed event.
+_BRIDGE_ABI_JSON = '''
+[
+    {
+        "anonymous": false,
+        "inputs": [
+            {
+                "indexed": true,
+                "internalType": "address",
+                "name": "user",
+                "type": "address"
+            },
+            {
+                "indexed": true,
+                "internalType": "address",
+                "name": "token",
+                "type": "address"
+            },
+            {
+                "indexed": false,
+                "internalType": "uint256",
+                "name": "amount",
+                "type": "uint256"
+            },
+            {
+                "indexed": false,
+                "internalType": "uint256",
+                "name": "destinationChainId",
+                "type": "uint256"
+            }
+        ],
+        "name": "BridgeDepositInitiated",
+        "type": "event"
+    }
+]
+'''
+_BRIDGE_ABI: List[Dict[str, Any]] = json.loads(_BRIDGE_ABI_JSON)
+_DEPOSIT_EVENT_ABI: Dict[str, Any] = next(
+    entry for entry in _BRIDGE_ABI if entry['type'] == 'event' and entry['name'] == 'BridgeDepositInitiated'
+)
+
+
 class ChainConnector:
     """
     Manages the connection to a specific blockchain via Web3.py.
@@ -38,6 +111,9 @@ class ChainConnector:
     blockchain interactions.
     """
 
+    # Seconds during which a fetched block number is reused instead of re-queried
+    BLOCK_NUMBER_TTL = 0.5
+
     def __init__(self, rpc_url: str, contract_address: str, contract_abi: List[Dict[str, Any]]):
         """
         Initializes the connection to the blockchain.
@@ -55,6 +131,8 @@ class ChainConnector:
         self.contract_abi = contract_abi
         self.web3: Optional[Web3] = None
         self.contract: Optional[Contract] = None
+        self._block_number = 0
+        self._block_number_fetched_at = float('-inf')
         self._connect()
 
     def _connect(self):
@@ -63,29 +141,46 @@ class ChainConnector:
         Handles connection errors and retries internally.
         """
         try:
-            self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            if self.uses_websocket:
+                provider = Web3.WebsocketProvider(self.rpc_url)
+            else:
+                provider = Web3.HTTPProvider(self.rpc_url)
+            self.web3 = Web3(provider)
             if not self.web3.is_connected():
                 raise ConnectionError(f"Failed to connect to blockchain node at {self.rpc_url}")
             
             # Checksum address is a best practice
-            checksum_address = self.web3.to_checksum_address(self.contract_address)
+            checksum_address = _checksum(self.contract_address)
             self.contract = self.web3.eth.contract(address=checksum_address, abi=self.contract_abi)
-            logger.info(f"Successfully connected to RPC endpoint and loaded contract at {self.contract_address}")
+            logger.info("Successfully connected to RPC endpoint and loaded contract at %s", self.contract_address)
         except Exception as e:
-            logger.error(f"Error connecting to blockchain: {e}")
+            logger.error("Error connecting to blockchain: %s", e)
             # In a real-world scenario, you might implement a retry mechanism here.
             raise ConnectionError(f"Could not establish connection to {self.rpc_url}") from e
 
+    @property
+    def uses_websocket(self) -> bool:
+        """
+        Whether the RPC URL points to a WebSocket endpoint, which supports push subscriptions.
+        """
+        return self.rpc_url.startswith(("ws://", "wss://"))
+
     def get_latest_block_number(self) -> int:
         """
         Fetches the most recent block number from the connected chain.
+        Calls within `BLOCK_NUMBER_TTL` seconds of a fetch reuse its result
+        instead of issuing another eth_blockNumber request.
         
         Returns:
             int: The latest block number.
         """
         if not self.web3:
             raise ConnectionError("Web3 provider not initialized.")
-        return self.web3.eth.block_number
+        now = time.monotonic()
+        if now - self._block_number_fetched_at >= self.BLOCK_NUMBER_TTL:
+            self._block_number = self.web3.eth.block_number
+            self._block_number_fetched_at = now
+        return self._block_number
 
 
 class DestinationChainOracle:
@@ -110,8 +205,22 @@ class DestinationChainOracle:
             "Content-Type": "application/json",
             "X-API-KEY": api_key
         }
+        # A single shared session so every relay after the first reuses a
+        # kept-alive connection instead of paying for a new TCP+TLS handshake.
+        # Must be created from within a running event loop.
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=60),
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
 
-    def relay_event(self, event_data: Dict[str, Any]) -> bool:
+    async def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        await self.session.close()
+
+    async def relay_event(self, event_data: Dict[str, Any]) -> bool:
         """
         Sends the event data to the destination chain's simulated relayer service.
 
@@ -131,19 +240,86 @@ class DestinationChainOracle:
                 "amount": event_data['amount'],
                 "block_number": event_data['block_number']
             }
-            logger.info(f"Relaying event to {self.api_endpoint} with payload: {payload}")
-            
-            # Using requests library to make an external HTTP POST request
-            response = requests.post(self.api_endpoint, headers=self.headers, json=payload, timeout=10)
+            logger.info("Relaying event to %s with payload: %s", self.api_endpoint, payload)
             
-            response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx)
-            
-            logger.info(f"Successfully relayed event. Destination API response: {response.json()}")
+            # Using aiohttp so that relays for several events can overlap
+            # Serialized straight to bytes; the session already sends the JSON Content-Type
+            async with self.session.post(self.api_endpoint, data=self._encode_payload(payload)) as response:
+                response.raise_for_status()  # Raises a ClientResponseError for bad responses (4xx or 5xx)
+                response_body = orjson.loads(await response.read())
+
+            logger.info("Successfully relayed event. Destination API response: %s", response_body)
             return True
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to relay event to destination chain API: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Failed to relay event to destination chain API: %s", e)
+            return False
+        except (TypeError, ValueError) as e:
+            logger.error("Failed to encode event payload for the destination chain API: %s", e)
             return False
 
+    @staticmethod
+    def _encode_payload(payload: Dict[str, Any]) -> bytes:
+        """
+        Serializes a payload to JSON bytes.
+
+        orjson is used for speed, but it rejects integers wider than 64 bits,
+        which uint256 event fields can hold; those payloads fall back to the
+        standard library encoder.
+        """
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            return json.dumps(payload).encode()
+
+
+class EventLogDecoder:
+    """
+    Decodes raw logs of a single contract event directly from its ABI entry.
+
+    The topic0 hash and the indexed/data field layouts are computed once, so
+    decoding a log is a single eth_abi call on its data plus a slice of each
+    indexed topic. This skips web3.py's generic per-log event processing.
+    """
+
+    def __init__(self, event_abi: Dict[str, Any]):
+        """
+        Precomputes the topic hash and field layouts of the event.
+
+        Args:
+            event_abi (Dict[str, Any]): The ABI entry of the event.
+        """
+        self.name = event_abi['name']
+        self.topic0 = event_abi_to_log_topic(event_abi)
+        indexed_inputs = [i for i in event_abi['inputs'] if i['indexed']]
+        data_inputs = [i for i in event_abi['inputs'] if not i['indexed']]
+        self.indexed_fields = [(i['name'], i['type']) for i in indexed_inputs]
+        self.data_names = [i['name'] for i in data_inputs]
+        self.data_types = [i['type'] for i in data_inputs]
+
+    def decode(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decodes the arguments of a raw log of this event.
+
+        Returns:
+            Dict[str, Any]: The event name, its decoded arguments and the log's location on chain.
+        """
+        args = dict(zip(self.data_names, abi_decode(self.data_types, bytes(log['data']))))
+        for (name, arg_type), topic in zip(self.indexed_fields, log['topics'][1:]):
+            if arg_type == 'address':
+                args[name] = _checksum(bytes(topic[-20:]))
+            elif arg_type in ('string', 'bytes') or arg_type.endswith(']'):
+                # Dynamic indexed values are only stored as their hash
+                args[name] = topic
+            else:
+                args[name] = abi_decode([arg_type], topic)[0]
+        return {
+            "event": self.name,
+            "args": args,
+            "transactionHash": log['transactionHash'],
+            "logIndex": log['logIndex'],
+            "blockNumber": log['blockNumber'],
+        }
+
 
 class EventListenerService:
     """
@@ -153,116 +329,352 @@ class EventListenerService:
     DestinationChainOracle to form a complete event-listening pipeline.
     """
 
-    def __init__(self, chain_connector: ChainConnector, oracle: DestinationChainOracle, event_name: str, source_chain_id: int):
+    # Number of recently processed (transactionHash, logIndex) keys remembered for deduplication
+    SEEN_EVENTS_CACHE_SIZE = 8192
+    # Number of concurrent relay workers and the capacity of the queue feeding them
+    RELAY_WORKERS = 8
+    RELAY_QUEUE_SIZE = 1024
+    # Seconds to wait for queued events to be relayed when the listener stops
+    RELAY_DRAIN_TIMEOUT = 30
+    # Number of `max_block_range` chunks fetched concurrently when catching up on a backlog
+    BACKFILL_CONCURRENCY = 4
+
+    def __init__(self, chain_connector: ChainConnector, oracle: DestinationChainOracle, event_abis: List[Dict[str, Any]], source_chain_id: int, max_block_range: int = 2000):
         """
         Initializes the event listener service.
 
         Args:
             chain_connector (ChainConnector): The connector for the source blockchain.
             oracle (DestinationChainOracle): The oracle for relaying events to the destination.
-            event_name (str): The name of the contract event to listen for.
+            event_abis (List[Dict[str, Any]]): The ABI entries of the contract events to listen for.
             source_chain_id (int): The identifier for the source chain.
+            max_block_range (int): The maximum number of blocks to query in a single eth_getLogs call.
         """
         self.connector = chain_connector
         self.oracle = oracle
-        self.event_name = event_name
+        self.event_names = [event_abi['name'] for event_abi in event_abis]
         self.source_chain_id = source_chain_id
-        self.event_filter = self._create_event_filter()
+        self.max_block_range = max_block_range
+        # A poll covering this many blocks means the listener is still catching up
+        self.max_blocks_per_poll = max_block_range * self.BACKFILL_CONCURRENCY
+        self.decoders_by_topic = self._build_event_dispatch(event_abis)
         self.last_processed_block = self.connector.get_latest_block_number() - 1
+        # Events already handled, so that backfills overlapping a subscription
+        # or a retried batch never relay the same event twice
+        self._seen: collections.OrderedDict = collections.OrderedDict()
+        # Processed events waiting to be relayed, consumed by the relay workers
+        self._relay_queue: asyncio.Queue = asyncio.Queue(maxsize=self.RELAY_QUEUE_SIZE)
+        # Number of consecutive polls that found no events, drives the poll backoff
+        self._idle_polls = 0
+
+    def _build_event_dispatch(self, event_abis: List[Dict[str, Any]]) -> Dict[bytes, EventLogDecoder]:
+        """
+        Maps the topic0 hash of every listened-for event to its log decoder.
 
-    def _create_event_filter(self):
+        This lets a single eth_getLogs call fetch all event types at once, with
+        each returned log dispatched to the right decoder by its first topic.
         """
-        Creates a Web3.py event filter for the specified event.
+        decoders_by_topic = {}
+        for event_abi in event_abis:
+            decoder = EventLogDecoder(event_abi)
+            decoders_by_topic[decoder.topic0] = decoder
+        return decoders_by_topic
+
+    async def _fetch_new_logs(self) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetches event logs for the blocks following the last processed block.
+
+        Uses stateless eth_getLogs range queries instead of a server-side filter,
+        so nothing is lost when the node restarts. Each query is clamped to
+        `max_block_range` blocks to avoid node timeouts on busy chains; when the
+        listener is further behind, up to `BACKFILL_CONCURRENCY` such chunks are
+        fetched per poll, concurrently over HTTP.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The decoded event logs, ordered by block and log index,
+                and the last block of the queried range.
+        """
+        # Web3 calls are blocking, so run them off the event loop
+        from_block = self.last_processed_block + 1
+        latest_block = await asyncio.to_thread(self.connector.get_latest_block_number)
+        to_block = min(latest_block, from_block + self.max_blocks_per_poll - 1)
+        if to_block < from_block:
+            return [], self.last_processed_block
+
+        ranges = [
+            (start, min(start + self.max_block_range - 1, to_block))
+            for start in range(from_block, to_block + 1, self.max_block_range)
+        ]
+        if self.connector.uses_websocket:
+            # The sync WebSocket provider shares one socket with no request-id
+            # matching, so overlapping calls on it would mix up responses
+            chunks = [await asyncio.to_thread(self._get_logs_in_range, start, end) for start, end in ranges]
+        else:
+            chunks = await asyncio.gather(*(
+                asyncio.to_thread(self._get_logs_in_range, start, end) for start, end in ranges
+            ))
+        logs = sorted(
+            (event for chunk in chunks for event in chunk),
+            key=lambda event: (event['blockNumber'], event['logIndex'])
+        )
+        return logs, to_block
+
+    def _get_logs_in_range(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """
+        Fetches and decodes the logs of a single block range. All event types
+        are requested in one call by OR-ing their topic0 hashes.
+        """
+        raw_logs = self.connector.web3.eth.get_logs({
+            **self._log_filter_params(),
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        })
+        return [event for event in map(self._decode_log, raw_logs) if event is not None]
+
+    def _log_filter_params(self) -> Dict[str, Any]:
+        """
+        Builds the address/topics filter matching every listened-for event type.
         """
         if not self.connector.contract:
             raise ValueError("Contract not initialized in ChainConnector.")
-        try:
-            event = getattr(self.connector.contract.events, self.event_name)
-            return event.create_filter(fromBlock='latest')
-        except AttributeError:
-            logger.error(f"Event '{self.event_name}' not found in contract ABI.")
-            raise
+        return {
+            "address": self.connector.contract.address,
+            "topics": [[Web3.to_hex(topic) for topic in self.decoders_by_topic]],
+        }
+
+    def _decode_log(self, log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decodes a raw log with the event matching its topic0 hash.
 
-    def _process_event(self, event: Dict[str, Any]):
+        Returns:
+            Optional[Dict[str, Any]]: The decoded event, or None if the log matches no listened-for event.
         """
-        Processes a single event log.
-        This involves formatting the data and passing it to the oracle.
+        decoder = self.decoders_by_topic.get(log['topics'][0]) if log['topics'] else None
+        if decoder is None:
+            logger.warning("Received log with unexpected topic. Skipping. Log: %s", log)
+            return None
+        return decoder.decode(log)
+
+    async def _process_raw(self, log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        logger.info(f"New event received: {self.event_name} in transaction {event['transactionHash'].hex()}")
-        
-        # Edge case: Handle potential malformed events or missing arguments
-        if 'args' not in event:
-            logger.warning(f"Event log is missing 'args' field. Skipping. Log: {event}")
+        Decodes and processes a single raw log, as pushed by an eth_subscribe subscription.
+        Logs the node re-sends as removed after a chain reorganization are skipped.
+
+        Returns:
+            Optional[Dict[str, Any]]: The decoded event, or None if the log was removed
+                or matches no listened-for event.
+        """
+        if log.get('removed'):
+            logger.warning("Skipping log removed by a chain reorganization at log index %s of tx %s", log['logIndex'], log['transactionHash'].hex())
+            return None
+        event = self._decode_log(log)
+        if event is not None:
+            await self._process_decoded(event)
+        return event
+
+    async def _process_decoded(self, event: Dict[str, Any]):
+        """
+        Processes a single decoded event.
+        This involves formatting the data and queueing it for the relay workers.
+        Events that were already processed are skipped.
+        """
+        key = (event['transactionHash'], event['logIndex'])
+        if key in self._seen:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping already processed event at log index %d of tx %s", event['logIndex'], event['transactionHash'].hex())
             return
+        self._seen[key] = True
+        if len(self._seen) > self.SEEN_EVENTS_CACHE_SIZE:
+            self._seen.popitem(last=False)
+
+        tx_hash = event['transactionHash'].hex()
+        logger.info("New event received: %s in transaction %s", event['event'], tx_hash)
 
         event_args = event['args']
         processed_data = {
-            "transactionHash": event['transactionHash'].hex(),
+            "transactionHash": tx_hash,
             "block_number": event['blockNumber'],
             "source_chain_id": self.source_chain_id,
-            "destination_chain_id": event_args.get('destinationChainId'),
-            "user": event_args.get('user'),
-            "token": event_args.get('token'),
-            "amount": str(event_args.get('amount')) # Convert BigNumber to string for JSON serialization
+            "destination_chain_id": event_args['destinationChainId'],
+            "user": event_args['user'],
+            "token": event_args['token'],
+            "amount": str(event_args['amount']) # Convert BigNumber to string for JSON serialization
         }
+        # Blocks only when the relay workers are a full queue behind
+        await self._relay_queue.put(processed_data)
 
-        # Retry logic for the oracle relay
-        max_retries = 3
+    async def _relay_worker(self):
+        """
+        Relays queued events to the oracle, retrying each independently.
+
+        Running several workers means a failing relay, while it backs off,
+        never stalls ingestion or the relay of other events.
+        """
+        while True:
+            processed_data = await self._relay_queue.get()
+            try:
+                await self._relay_with_retries(processed_data)
+            except asyncio.CancelledError:
+                logger.error("Relay of event for tx %s was interrupted by shutdown. Manual intervention required.", processed_data['transactionHash'])
+                raise
+            except Exception as e:
+                logger.error("Unexpected error while relaying event for tx %s: %s", processed_data['transactionHash'], e, exc_info=True)
+            finally:
+                self._relay_queue.task_done()
+
+    async def _relay_with_retries(self, processed_data: Dict[str, Any]):
+        """
+        Passes a processed event to the oracle, with exponential backoff between failed attempts.
+        Each delay gets up to 25% random jitter so that events failing together
+        do not all retry at the same moment.
+        """
+        max_retries = len(_BACKOFF) + 1
         for attempt in range(max_retries):
-            if self.oracle.relay_event(processed_data):
-                logger.info(f"Successfully processed and relayed event for tx {processed_data['transactionHash']}")
+            if await self.oracle.relay_event(processed_data):
+                logger.info("Successfully processed and relayed event for tx %s", processed_data['transactionHash'])
                 # Here you might persist the state to a DB to avoid reprocessing
                 break
-            else:
-                logger.warning(f"Attempt {attempt + 1}/{max_retries} to relay event failed. Retrying...")
-                time.sleep(2 ** attempt)  # Exponential backoff
+            elif attempt < len(_BACKOFF):
+                logger.warning("Attempt %d/%d to relay event failed. Retrying...", attempt + 1, max_retries)
+                delay = _BACKOFF[attempt]
+                await asyncio.sleep(delay + random.uniform(0, 0.25 * delay))  # Exponential backoff with jitter
         else:
-            logger.error(f"Failed to relay event after {max_retries} attempts. Manual intervention required.")
+            logger.error("Failed to relay event after %d attempts. Manual intervention required.", max_retries)
 
-    def run(self, poll_interval: int = 5):
+    async def run(self, poll_interval: float = 1, max_poll_interval: float = 30):
         """
         Starts the main event listening loop.
         
         Args:
-            poll_interval (int): The time in seconds to wait between polling for new events.
+            poll_interval (float): The time in seconds to wait between polls that found new events.
+                Each consecutive poll without events doubles the wait, up to `max_poll_interval`.
+                Unused when connected over WebSocket, where the node pushes new logs.
+            max_poll_interval (float): The longest time in seconds to wait between polls on a quiet chain.
+        """
+        logger.info("Starting event listener for %s events...", ", ".join(self.event_names))
+        workers = [asyncio.create_task(self._relay_worker()) for _ in range(self.RELAY_WORKERS)]
+        try:
+            await self._listen(poll_interval, max_poll_interval)
+        finally:
+            await self._stop_relay_workers(workers)
+
+    async def _stop_relay_workers(self, workers: List[asyncio.Task]):
+        """
+        Gives the relay workers a bounded time to drain the queue, then cancels them.
+
+        Queued events have already advanced `last_processed_block`, so any that
+        could not be relayed in time are logged for manual intervention.
+        """
+        if not self._relay_queue.empty():
+            logger.info("Waiting up to %ss for %d queued events to be relayed...", self.RELAY_DRAIN_TIMEOUT, self._relay_queue.qsize())
+        try:
+            await asyncio.wait_for(self._relay_queue.join(), self.RELAY_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        unrelayed = []
+        while not self._relay_queue.empty():
+            unrelayed.append(self._relay_queue.get_nowait()['transactionHash'])
+            self._relay_queue.task_done()
+        if unrelayed:
+            logger.error(
+                "%d queued events were not relayed before shutdown. Manual intervention required for txs: %s",
+                len(unrelayed), ", ".join(unrelayed)
+            )
+
+    async def _listen(self, poll_interval: float, max_poll_interval: float):
+        """
+        Runs the event ingestion loop, reconnecting after unexpected errors.
         """
-        logger.info(f"Starting event listener for '{self.event_name}' events...")
         while True:
             try:
-                # Fetch new logs since the last poll
-                logs = self.event_filter.get_new_entries()
-                if logs:
-                    for event in logs:
-                        self._process_event(event)
+                if self.connector.uses_websocket:
+                    # Events are pushed by the node; only returns if the socket drops
+                    await self._listen_for_pushed_logs()
                 else:
-                    logger.debug("No new events found in this poll.")
-                
-                time.sleep(poll_interval)
-
-            except KeyboardInterrupt:
+                    if await self._poll_once() >= self.max_blocks_per_poll:
+                        # Still behind the chain tip, keep catching up without waiting
+                        continue
+                    # Back off exponentially while the chain is quiet
+                    interval = min(max_poll_interval, poll_interval * (1 << min(self._idle_polls, 5)))
+                    await asyncio.sleep(interval)
+
+            except asyncio.CancelledError:
                 logger.info("Shutdown signal received. Exiting gracefully.")
-                break
+                raise
             except Exception as e:
                 # Catch-all for unexpected errors, to ensure the listener keeps running.
-                logger.critical(f"An unexpected error occurred in the main loop: {e}", exc_info=True)
+                logger.critical("An unexpected error occurred in the main loop: %s", e, exc_info=True)
                 logger.info("Attempting to reconnect and restart listening...")
-                time.sleep(15) # Wait before restarting to avoid spamming a broken endpoint
-                self._reconnect_and_recreate_filter()
+                await asyncio.sleep(15) # Wait before restarting to avoid spamming a broken endpoint
+                await asyncio.to_thread(self._reconnect)
+
+    async def _poll_once(self) -> int:
+        """
+        Fetches and processes the logs of all blocks since the last poll.
+
+        Returns:
+            int: The number of blocks covered by this poll.
+        """
+        previous_block = self.last_processed_block
+        logs, to_block = await self._fetch_new_logs()
+        if logs:
+            self._idle_polls = 0
+            for event in logs:
+                await self._process_decoded(event)
+        else:
+            # A full backlog window without events says nothing about the chain being quiet
+            if to_block - previous_block < self.max_blocks_per_poll:
+                self._idle_polls += 1
+            logger.debug("No new events found in this poll.")
+        # Only advance once every event of the batch has been queued
+        self.last_processed_block = to_block
+        return to_block - previous_block
+
+    async def _listen_for_pushed_logs(self):
+        """
+        Subscribes to matching logs over a persistent WebSocket and processes them as they are pushed.
 
-    def _reconnect_and_recreate_filter(self):
+        The subscription is opened before catching up on blocks missed while
+        disconnected, so no event falls in between. Socket drops are detected by
+        the WebSocket ping/pong heartbeat and surface as exceptions to `run`,
+        which reconnects.
         """
-        Handles reconnection to the RPC and recreation of the event filter.
+        async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.connector.rpc_url)) as w3:
+            await w3.eth.subscribe("logs", self._log_filter_params())
+            logger.info("Subscribed to pushed logs over WebSocket.")
+
+            # Backfill anything emitted since the last processed block
+            while await self._poll_once() >= self.max_blocks_per_poll:
+                pass
+
+            async for response in w3.ws.listen_to_websocket():
+                event = await self._process_raw(response['result'])
+                if event is None:
+                    continue
+                # Other logs of the same block may still arrive, so only the
+                # preceding block is known to be complete.
+                self.last_processed_block = max(self.last_processed_block, event['blockNumber'] - 1)
+
+    def _reconnect(self):
+        """
+        Handles reconnection to the RPC.
         This is a critical resilience feature for long-running services.
+        Since logs are fetched by block range, listening resumes from
+        `last_processed_block` and no events are missed during the outage.
         """
         try:
             self.connector._connect() # Re-establish connection
-            self.event_filter = self._create_event_filter() # Re-create the filter
-            logger.info("Successfully reconnected and recreated event filter.")
+            logger.info("Successfully reconnected to the RPC endpoint.")
         except Exception as e:
-            logger.error(f"Failed to reconnect or recreate filter: {e}. Will retry on next cycle.")
+            logger.error("Failed to reconnect: %s. Will retry on next cycle.", e)
 
 
-def main():
+async def main():
     """
     Main function to set up and run the service.
     """
@@ -277,50 +689,12 @@ def main():
         logger.error("One or more environment variables are missing. Please check your .env file.")
         return
 
-    # --- Mock Contract ABI ---
-    # In a real project, this would be loaded from a JSON file.
-    BRIDGE_ABI = json.loads('''
-    [
-        {
-            "anonymous": false,
-            "inputs": [
-                {
-                    "indexed": true,
-                    "internalType": "address",
-                    "name": "user",
-                    "type": "address"
-                },
-                {
-                    "indexed": true,
-                    "internalType": "address",
-                    "name": "token",
-                    "type": "address"
-                },
-                {
-                    "indexed": false,
-                    "internalType": "uint256",
-                    "name": "amount",
-                    "type": "uint256"
-                },
-                {
-                    "indexed": false,
-                    "internalType": "uint256",
-                    "name": "destinationChainId",
-                    "type": "uint256"
-                }
-            ],
-            "name": "BridgeDepositInitiated",
-            "type": "event"
-        }
-    ]
-    ''')
-
     try:
         # 1. Initialize the connection to the source chain
         chain_connector = ChainConnector(
             rpc_url=SOURCE_CHAIN_RPC_URL,
             contract_address=BRIDGE_CONTRACT_ADDRESS,
-            contract_abi=BRIDGE_ABI
+            contract_abi=_BRIDGE_ABI
         )
 
         # 2. Initialize the destination chain oracle/relayer
@@ -329,24 +703,33 @@ def main():
             api_key=DESTINATION_API_KEY
         )
 
-        # 3. Initialize and run the main listener service
-        listener_service = EventListenerService(
-            chain_connector=chain_connector,
-            oracle=oracle,
-            event_name="BridgeDepositInitiated",
-            source_chain_id=1 # Example: 1 for Ethereum Mainnet
-        )
-
-        listener_service.run()
+        try:
+            # 3. Initialize and run the main listener service
+            listener_service = EventListenerService(
+                chain_connector=chain_connector,
+                oracle=oracle,
+                event_abis=[_DEPOSIT_EVENT_ABI],
+                source_chain_id=1 # Example: 1 for Ethereum Mainnet
+            )
+
+            await listener_service.run()
+        finally:
+            await oracle.close()
 
     except ConnectionError as e:
-        logger.critical(f"Failed to initialize the service due to a connection error: {e}")
+        logger.critical("Failed to initialize the service due to a connection error: %s", e)
     except Exception as e:
-        logger.critical(f"A fatal error occurred during service setup: {e}", exc_info=True)
+        logger.critical("A fatal error occurred during service setup: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Service stopped.")
  
 # @-internal-utility-start
 # Historical update 2025-10-10 11:54:39